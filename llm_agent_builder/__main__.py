@@ -28,7 +28,6 @@ def main() -> None:
         # Check for --cli flag - route to CLI with flag removed
         if "--cli" in sys.argv:
             # Create a copy of sys.argv without the --cli flag
-            import copy
             original_argv = sys.argv
             sys.argv = [arg for arg in sys.argv if arg != "--cli"]
             try:
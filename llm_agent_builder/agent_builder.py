@@ -1,7 +1,7 @@
 import os
 from typing import Any, Dict, List, Optional
 
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, FileSystemLoader, Template
 from .providers import ProviderRegistry
 
 
@@ -17,6 +17,8 @@ class AgentBuilder:
                 template_path = os.path.join(os.path.dirname(__file__), 'templates')
             self.env = Environment(loader=FileSystemLoader(template_path))
             self.template = self.env.get_template('agent_template.py.j2')
+        # Provider templates resolved so far, keyed by provider name
+        self._provider_templates: Dict[str, Template] = {}
 
     def build_agent(
         self, 
@@ -45,11 +47,13 @@ class AgentBuilder:
         :return: The generated Python code as a string.
         """
         
-        # Use provider registry to get the template name
-        provider_instance = ProviderRegistry.get(provider)
-        template_name = provider_instance.get_template_name()
-            
-        template = self.env.get_template(template_name)
+        # Resolve each provider's template once per builder, so batch runs skip
+        # the registry lookup and Jinja2's up-to-date check on every agent.
+        template = self._provider_templates.get(provider)
+        if template is None:
+            provider_instance = ProviderRegistry.get(provider)
+            template = self.env.get_template(provider_instance.get_template_name())
+            self._provider_templates[provider] = template
 
         return template.render(
             agent_name=agent_name,
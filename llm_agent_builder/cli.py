@@ -1,66 +1,158 @@
 import argparse
+import codecs
+import functools
+import heapq
+import importlib
+import itertools
 import json
 import os
+import re
 import subprocess
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 # Add parent directory to path to allow running script directly
 # This allows the script to be run as: python llm_agent_builder/cli.py
 # or as: python -m llm_agent_builder.cli
-_script_dir = Path(__file__).resolve().parent
-_project_root = _script_dir.parent
-if str(_project_root) not in sys.path:
-    sys.path.insert(0, str(_project_root))
+# os.path.abspath avoids the realpath syscalls Path.resolve() makes per component
+_project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _project_root not in sys.path:
+    sys.path.insert(0, _project_root)
 
-from dotenv import load_dotenv
 
-from llm_agent_builder.agent_builder import AgentBuilder
+@functools.lru_cache(maxsize=None)
+def _optional_module(name: str) -> Any:
+    """Import an optional dependency on first use, or return None if missing."""
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        return None
+
+
+# orjson is optional; it parses bytes directly and is markedly faster than the
+# stdlib for large batch and tools files. Its JSONDecodeError subclasses the
+# stdlib one, so callers only need to catch json.JSONDecodeError. It and ijson
+# (used to stream large batch arrays) are imported on first use, so commands
+# such as ``list`` that never touch JSON do not pay for loading them.
+def _json_loads(data: Union[str, bytes]) -> Any:
+    """Parse JSON ``data``, using orjson when it is installed."""
+    orjson = _optional_module("orjson")
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Below this size a one-shot parse (orjson especially) beats streaming with
+# ijson, so arrays are loaded whole; above it, streaming bounds memory use
+_BATCH_STREAM_THRESHOLD_BYTES = 10 * 1024 * 1024
+
+
+def _json_dumps(obj: Any) -> str:
+    """Serialize ``obj`` as JSON indented by two spaces."""
+    orjson = _optional_module("orjson")
+    if orjson is not None:
+        return str(orjson.dumps(obj, option=orjson.OPT_INDENT_2), "utf-8")
+    return json.dumps(obj, indent=2)
 
 
 def get_input(prompt: str, default: str, validator=None) -> str:
-    """Get user input with optional validation."""
-    while True:
-        value = input(f"{prompt} [{default}]: ").strip()
-        value = value if value else default
-        if validator:
-            try:
-                validator(value)
-                return value
-            except ValueError as e:
-                print(f"Error: {e}. Please try again.")
-                continue
-        return value
+    """
+    Get user input with optional validation.
+
+    The default is shown in brackets and used for an empty answer. On
+    terminals with readline support, a rejected answer is pre-filled on the
+    retry so it can be corrected in place rather than retyped.
+    """
+    readline = _optional_module("readline") if sys.stdin.isatty() else None
+    # Format the prompt once; validation retries reuse the same string
+    prompt_text = f"{prompt} [{default}]: "
+    try:
+        while True:
+            value = input(prompt_text).strip()
+            value = value if value else default
+            if validator:
+                try:
+                    validator(value)
+                    return value
+                except ValueError as e:
+                    print(f"Error: {e}. Please try again.")
+                    if readline is not None:
+                        readline.set_startup_hook(functools.partial(readline.insert_text, value))
+                    continue
+            return value
+    finally:
+        if readline is not None:
+            readline.set_startup_hook()
+
+
+# Unicode \w is exactly str.isalnum() plus "_", so Unicode letters stay valid.
+# The lookahead requires at least one alphanumeric ([^\W_]), so names made
+# only of "-" and "_" are rejected as they were by the old isalnum() check.
+_AGENT_NAME_RE = re.compile(r"(?=[\w-]*[^\W_])[\w-]+")
+
+
+def _is_valid_agent_name(name: str) -> bool:
+    """Return True if ``name`` is alphanumeric apart from underscores and hyphens."""
+    return _AGENT_NAME_RE.fullmatch(name) is not None
 
 
 def validate_agent_name(name: str) -> None:
     """Validate agent name."""
     if not name:
         raise ValueError("Agent name cannot be empty")
-    if not name.replace("_", "").replace("-", "").isalnum():
+    if not _is_valid_agent_name(name):
         raise ValueError("Agent name must be alphanumeric (with underscores or hyphens)")
 
 
-def list_agents(output_dir: str = "generated_agents") -> None:
-    """List all generated agents."""
-    output_path = Path(output_dir)
-    if not output_path.exists():
+def list_agents(output_dir: str = "generated_agents", limit: Optional[int] = None) -> None:
+    """List generated agents, showing only the first ``limit`` by name if given."""
+    # A single scandir pass gets names and file types without a stat per entry
+    try:
+        with os.scandir(output_dir) as entries:
+            agents = [entry.name for entry in entries if entry.name.endswith(".py") and entry.is_file()]
+    except FileNotFoundError:
         print(f"Output directory '{output_dir}' does not exist.")
         return
+    except NotADirectoryError:
+        agents = []
 
-    agents = list(output_path.glob("*.py"))
     if not agents:
         print(f"No agents found in '{output_dir}'.")
         return
 
-    print(f"\nFound {len(agents)} agent(s) in '{output_dir}':")
+    total = len(agents)
+    if limit is not None and limit < total:
+        # Partial selection is O(N log limit) instead of a full sort
+        agents = heapq.nsmallest(limit, agents)
+    else:
+        agents.sort()
+    print(f"\nFound {total} agent(s) in '{output_dir}':")
     print("-" * 60)
-    for agent_file in sorted(agents):
-        print(f"  • {agent_file.stem}")
+    # One writelines call instead of a print (and stdout lock) per agent
+    sys.stdout.writelines(f"  • {agent_file[:-3]}\n" for agent_file in agents)
+    if len(agents) < total:
+        print(f"  ... and {total - len(agents)} more")
     print("-" * 60)
 
 
+# Model generate uses when --model is not given, by provider
+_HF_DEFAULT_MODEL = "meta-llama/Meta-Llama-3-8B-Instruct"
+_PROVIDER_DEFAULT_MODELS = {
+    "google": "gemini-1.5-pro",
+    "huggingface": _HF_DEFAULT_MODEL,
+    "huggingchat": _HF_DEFAULT_MODEL,
+}
+
+
+@functools.lru_cache(maxsize=1)
+def _configuration_status() -> Dict[str, Dict[str, Any]]:
+    """Return provider API key status, computed once per CLI invocation."""
+    from llm_agent_builder.config import get_config_manager
+
+    return get_config_manager().get_configuration_status()
+
+
 def test_agent(agent_path: str, task: Optional[str] = None) -> None:
     """Test a generated agent."""
     agent_file = Path(agent_path)
@@ -68,14 +160,11 @@ def test_agent(agent_path: str, task: Optional[str] = None) -> None:
         print(f"Error: Agent file '{agent_path}' not found.")
         sys.exit(1)
     
-    # Use ConfigManager to get API key
-    config_manager = get_config_manager()
-    api_key = config_manager.get_any_api_key()
-    
-    if not api_key:
+    # Provider key variables come from config, so custom api_key_env names count
+    provider_status = _configuration_status()
+    if not any(info["configured"] for info in provider_status.values()):
         print("Error: No API key found. Please configure at least one provider:")
-        status = config_manager.get_configuration_status()
-        for provider_name, info in status.items():
+        for provider_name, info in provider_status.items():
             print(f"  - {info['name']}: Set {info['env_var']}")
         sys.exit(1)
 
@@ -85,21 +174,15 @@ def test_agent(agent_path: str, task: Optional[str] = None) -> None:
             print("Error: Task cannot be empty.")
             sys.exit(1)
 
+    print("\n" + "=" * 60)
+    print("Agent Execution Result:")
+    print("=" * 60)
+    sys.stdout.flush()
     try:
         cmd = [sys.executable, str(agent_file), "--task", task]
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
-
-        if result.returncode == 0:
-            print("\n" + "=" * 60)
-            print("Agent Execution Result:")
-            print("=" * 60)
-            print(result.stdout)
-            if result.stderr:
-                print("\nWarnings/Errors:")
-                print(result.stderr)
-        else:
-            print(f"Error: Agent execution failed with code {result.returncode}")
-            print(result.stderr)
+        returncode = _run_agent_streaming(cmd, timeout=60)
+        if returncode != 0:
+            print(f"Error: Agent execution failed with code {returncode}")
             sys.exit(1)
     except subprocess.TimeoutExpired:
         print("Error: Agent execution timed out after 60 seconds.")
@@ -109,51 +192,257 @@ def test_agent(agent_path: str, task: Optional[str] = None) -> None:
         sys.exit(1)
 
 
-def batch_generate(config_file: str, output_dir: str = "generated_agents", template: Optional[str] = None) -> None:
-    """Generate multiple agents from a JSON configuration file."""
+def _run_agent_streaming(cmd: List[str], timeout: float) -> int:
+    """
+    Run ``cmd`` with our stdout and stderr, so its output appears as it arrives.
+
+    Output is never accumulated, so memory use does not grow with the
+    amount the agent prints. Returns the exit code; kills the process and
+    raises subprocess.TimeoutExpired if it runs longer than ``timeout``.
+    """
+    # close_fds=False lets CPython launch the agent via posix_spawn/vfork
+    # instead of fork+exec, which avoids copying this process's page tables.
+    # The trade-off is that the agent inherits any inheritable fds we hold.
+    # A Python child block-buffers stdout that is not a terminal, so it is
+    # told to run unbuffered; otherwise redirected output would lag behind.
+    env = {**os.environ, "PYTHONUNBUFFERED": "1"}
+    with subprocess.Popen(cmd, close_fds=False, env=env) as proc:
+        try:
+            return proc.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            raise
+
+
+def _write_agent_file(path: Union[str, Path], agent_code: str, dir_fd: Optional[int] = None) -> None:
+    """
+    Atomically write generated agent code to ``path`` as UTF-8.
+
+    The code goes to a temporary file next to ``path`` that is then renamed
+    over it, so an interrupted run never leaves a half-written agent behind.
+    If ``dir_fd`` is given, both names are resolved relative to that
+    directory descriptor, so the directory's own path is not looked up again.
+    """
+    head, tail = os.path.split(os.fspath(path))
+    # Per-process name, so concurrent batch workers never share a temp file
+    tmp_path = os.path.join(head, f".{tail}.{os.getpid()}.tmp")
+    # Writing the encoded bytes straight to the descriptor skips both the
+    # TextIOWrapper and BufferedWriter layers; loop in case a write is short
+    data = memoryview(agent_code.encode("utf-8"))
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    fd = os.open(tmp_path, flags, 0o666, dir_fd=dir_fd)
+    try:
+        try:
+            while data:
+                data = data[os.write(fd, data):]
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, path, src_dir_fd=dir_fd, dst_dir_fd=dir_fd)
+    except BaseException:
+        try:
+            os.unlink(tmp_path, dir_fd=dir_fd)
+        except OSError:
+            pass
+        raise
+
+
+def _open_output_dir(output_dir: str) -> Optional[int]:
+    """Open ``output_dir`` for relative writes, or return None where dir_fd is unsupported."""
+    if os.open not in os.supports_dir_fd:
+        return None
+    return os.open(output_dir, os.O_RDONLY | getattr(os, "O_DIRECTORY", 0))
+
+
+def _iter_json_lines(config_path: Path) -> Iterator[Dict[str, Any]]:
+    """Yield one agent configuration per non-blank line of a JSON Lines file."""
+    with open(config_path, "rb") as f:
+        for i, line in enumerate(f):
+            if i == 0 and line.startswith(codecs.BOM_UTF8):
+                line = line[len(codecs.BOM_UTF8):]
+            if line.strip():
+                yield _json_loads(line)
+
+
+def _iter_json_array(config_path: Path) -> Iterator[Dict[str, Any]]:
+    """Yield the elements of a top-level JSON array one at a time using ijson."""
+    with open(config_path, "rb") as f:
+        if f.read(len(codecs.BOM_UTF8)) != codecs.BOM_UTF8:
+            f.seek(0)
+        yield from _optional_module("ijson").items(f, "item", use_float=True)
+
+
+def _read_batch_configs(config_path: Path) -> Optional[Union[List[Any], Iterator[Dict[str, Any]]]]:
+    """
+    Read agent configurations from a batch configuration file.
+
+    A JSON array is loaded in one go, unless it is larger than
+    ``_BATCH_STREAM_THRESHOLD_BYTES`` and ijson is installed, in which case
+    it is streamed. A ``.jsonl`` file (JSON Lines, one object per line) is
+    always returned as a lazy iterator. Streamed input holds only one
+    configuration in memory at a time. Returns None if the file does not
+    hold an array; files that start with anything else are not parsed.
+    """
+    if config_path.suffix.lower() == ".jsonl":
+        return _iter_json_lines(config_path)
+    with open(config_path, "rb") as f:
+        # orjson rejects a UTF-8 byte order mark, so skip it before parsing
+        bom = f.read(len(codecs.BOM_UTF8)) == codecs.BOM_UTF8
+        if not bom:
+            f.seek(0)
+        head = f.read(64).lstrip()
+        if head and not head.startswith(b"["):
+            return None
+        if (
+            _optional_module("ijson") is not None
+            and head.startswith(b"[")
+            and os.fstat(f.fileno()).st_size >= _BATCH_STREAM_THRESHOLD_BYTES
+        ):
+            return _iter_json_array(config_path)
+        f.seek(len(codecs.BOM_UTF8) if bom else 0)
+        configs = _json_loads(f.read())
+    return configs if isinstance(configs, list) else None
+
+
+def _generate_batch_entry(
+    builder: Any, output_dir: str, i: int, config: Dict[str, Any], dir_fd: Optional[int] = None
+) -> str:
+    """Generate and write one agent from a batch entry, returning its progress line."""
+    try:
+        agent_name = config.get("name", f"Agent{i}")
+        prompt = config.get("prompt", "")
+        task = config.get("task", "")
+        model = config.get("model", "gemini-1.5-pro")
+        provider = config.get("provider", "google")
+        
+        if not prompt or not task:
+            return f"  [{i}] Skipping '{agent_name}': missing prompt or task"
+
+        agent_code = builder.build_agent(
+            agent_name=agent_name, prompt=prompt, example_task=task, model=model, provider=provider
+        )
+
+        # Plain string join; building a Path per entry is measurable in large batches
+        file_name = agent_name.lower() + ".py"
+        agent_file = os.path.join(output_dir, file_name)
+        _write_agent_file(file_name if dir_fd is not None else agent_file, agent_code, dir_fd)
+
+        return f"  [{i}] ✓ Generated '{agent_name}' -> {agent_file}"
+    except Exception as e:
+        return f"  [{i}] ✗ Error generating '{config.get('name', f'Agent{i}')}': {e}"
+
+
+# AgentBuilder and output directory descriptor owned by a batch worker
+# process, created by _init_batch_worker and released when the worker exits
+_worker_builder: Any = None
+_worker_dir_fd: Optional[int] = None
+
+
+def _init_batch_worker(template: Optional[str], output_dir: str) -> None:
+    """Create the AgentBuilder and output directory handle a batch worker reuses."""
+    global _worker_builder, _worker_dir_fd
+    from llm_agent_builder.agent_builder import AgentBuilder
+
+    _worker_builder = AgentBuilder(template_path=template)
+    _worker_dir_fd = _open_output_dir(output_dir)
+
+
+def _generate_batch_entry_in_worker(output_dir: str, item: Tuple[int, Dict[str, Any]]) -> str:
+    """Process-pool entry point for :func:`_generate_batch_entry`."""
+    return _generate_batch_entry(_worker_builder, output_dir, *item, _worker_dir_fd)
+
+
+# Entries per worker task when a streamed batch is run with --concurrency
+_STREAM_CHUNKSIZE = 16
+
+# Batch progress lines are written to stdout in blocks of this many entries
+_PROGRESS_BLOCK_SIZE = 100
+
+
+def _write_progress(lines: Iterable[str]) -> None:
+    """Write batch progress ``lines`` to stdout a block at a time."""
+    block: List[str] = []
+    try:
+        for line in lines:
+            block.append(line + "\n")
+            if len(block) >= _PROGRESS_BLOCK_SIZE:
+                sys.stdout.writelines(block)
+                sys.stdout.flush()
+                block.clear()
+    finally:
+        # Lines generated before an error or interrupt are still shown
+        sys.stdout.writelines(block)
+        sys.stdout.flush()
+
+
+def batch_generate(
+    config_file: str,
+    output_dir: str = "generated_agents",
+    template: Optional[str] = None,
+    concurrency: int = 1,
+) -> None:
+    """Generate multiple agents from a JSON or JSON Lines configuration file."""
     config_path = Path(config_file)
     if not config_path.exists():
         print(f"Error: Configuration file '{config_file}' not found.")
         sys.exit(1)
 
     try:
-        with open(config_path, "r") as f:
-            configs = json.load(f)
+        configs = _read_batch_configs(config_path)
 
-        if not isinstance(configs, list):
+        if configs is None:
             print("Error: Configuration file must contain a JSON array of agent configurations.")
             sys.exit(1)
 
-        builder = AgentBuilder(template_path=template)
         output_path = Path(output_dir)
         output_path.mkdir(exist_ok=True)
 
-        print(f"Generating {len(configs)} agent(s)...")
+        if isinstance(configs, list):
+            print(f"Generating {len(configs)} agent(s)...")
+        else:
+            print(f"Generating agents from '{config_file}'...")
         print("-" * 60)
 
-        for i, config in enumerate(configs, 1):
-            try:
-                agent_name = config.get("name", f"Agent{i}")
-                prompt = config.get("prompt", "")
-                task = config.get("task", "")
-                model = config.get("model", "gemini-1.5-pro")
-                provider = config.get("provider", "google")
-                
-                if not prompt or not task:
-                    print(f"  [{i}] Skipping '{agent_name}': missing prompt or task")
-                    continue
+        output_dir_str = os.fspath(output_path)
 
-                agent_code = builder.build_agent(
-                    agent_name=agent_name, prompt=prompt, example_task=task, model=model, provider=provider
-                )
+        if concurrency > 1:
+            # Template rendering is CPU-bound, so workers are processes rather
+            # than threads. Chunking amortises the IPC cost per entry, and
+            # executor.map keeps progress lines in input order.
+            from concurrent.futures import ProcessPoolExecutor
 
-                agent_file = output_path / f"{agent_name.lower()}.py"
-                with open(agent_file, "w") as f:
-                    f.write(agent_code)
+            entries = enumerate(configs, 1)
+            if isinstance(configs, list):
+                chunksize = max(1, len(configs) // (concurrency * 4))
+                window = len(configs)
+            else:
+                # Streamed input is submitted a window at a time, so only a
+                # bounded number of configurations is held in memory
+                chunksize = _STREAM_CHUNKSIZE
+                window = concurrency * 4 * chunksize
+            with ProcessPoolExecutor(
+                max_workers=concurrency, initializer=_init_batch_worker, initargs=(template, output_dir_str)
+            ) as executor:
+                worker = functools.partial(_generate_batch_entry_in_worker, output_dir_str)
+                _write_progress(
+                    line
+                    for items in iter(lambda: list(itertools.islice(entries, window)), [])
+                    for line in executor.map(worker, items, chunksize=chunksize)
+                )
+        else:
+            from llm_agent_builder.agent_builder import AgentBuilder
 
-                print(f"  [{i}] ✓ Generated '{agent_name}' -> {agent_file}")
-            except Exception as e:
-                print(f"  [{i}] ✗ Error generating '{config.get('name', f'Agent{i}')}': {e}")
+            builder = AgentBuilder(template_path=template)
+            # Writes go through one directory descriptor instead of
+            # resolving the output directory's path again for every file
+            dir_fd = _open_output_dir(output_dir_str)
+            try:
+                _write_progress(
+                    _generate_batch_entry(builder, output_dir_str, i, config, dir_fd)
+                    for i, config in enumerate(configs, 1)
+                )
+            finally:
+                if dir_fd is not None:
+                    os.close(dir_fd)
 
         print("-" * 60)
         print(f"Batch generation complete. Check '{output_dir}' for generated agents.")
@@ -210,7 +499,7 @@ def handle_config_command(args) -> None:
                     yaml.dump(config.model_dump(), f, default_flow_style=False, sort_keys=False)
             else:
                 with open(output_path, 'w') as f:
-                    json.dump(config.model_dump(), f, indent=2)
+                    f.write(_json_dumps(config.model_dump()))
             
             print(f"✓ Generated configuration file: {output_path}")
     
@@ -218,42 +507,8 @@ def handle_config_command(args) -> None:
         print(f"Error: {e}")
         sys.exit(1)
 
-def main() -> None:
-    load_dotenv()
-
-    parser = argparse.ArgumentParser(
-        description="LLM Agent Builder - Generate, test, and manage AI agents",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Examples:
-  # Generate an agent interactively
-  llm-agent-builder generate
-
-  # Generate with command-line arguments
-  llm-agent-builder generate --name CodeReviewer --prompt "You are a code reviewer" --task "Review this code"
-
-  # List all generated agents
-  llm-agent-builder list
-
-  # Test an agent
-  llm-agent-builder test generated_agents/myagent.py --task "Review this function"
-
-  # Batch generate from config file
-  llm-agent-builder batch agents.json
-  
-  # Configuration management
-  llm-agent-builder config show
-  llm-agent-builder config validate --file config/production.yaml
-  llm-agent-builder config generate
-        """
-    )
-    
-    # Global arguments
-    parser.add_argument("--config", help="Path to configuration file", dest="config_file")
-    
-    subparsers = parser.add_subparsers(dest="command", help="Available commands")
-
-    # Generate subcommand
+def _add_generate_parser(subparsers) -> None:
+    """Register the ``generate`` subcommand."""
     gen_parser = subparsers.add_parser("generate", help="Generate a new agent")
     gen_parser.add_argument("--name", default="MyAwesomeAgent", help="Name of the agent to be built")
     gen_parser.add_argument(
@@ -274,28 +529,67 @@ Examples:
     gen_parser.add_argument("--db-path", help="Path to a SQLite database for the agent to use")
     gen_parser.add_argument("--enable-multi-step", action="store_true", help="Enable multi-step workflow capabilities")
     gen_parser.add_argument("--tools", help="Path to JSON file containing tool definitions")
-    
-    # List subcommand
+
+
+def _non_negative_int(value: str) -> int:
+    """argparse type for options that take a count of zero or more."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}") from None
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"must be 0 or greater, got {number}")
+    return number
+
+
+def _positive_int(value: str) -> int:
+    """argparse type for options that take a count of one or more."""
+    number = _non_negative_int(value)
+    if number == 0:
+        raise argparse.ArgumentTypeError("must be 1 or greater, got 0")
+    return number
+
+
+def _add_list_parser(subparsers) -> None:
+    """Register the ``list`` subcommand."""
     list_parser = subparsers.add_parser("list", help="List all generated agents")
     list_parser.add_argument("--output", default="generated_agents", help="Output directory to search")
+    list_parser.add_argument("--limit", type=_non_negative_int, help="Show at most this many agents")
+
 
-    # Test subcommand
+def _add_test_parser(subparsers) -> None:
+    """Register the ``test`` subcommand."""
     test_parser = subparsers.add_parser("test", help="Test a generated agent")
     test_parser.add_argument("agent_path", help="Path to the agent Python file")
     test_parser.add_argument("--task", help="Task to test the agent with")
 
-    # Batch subcommand
+
+def _add_batch_parser(subparsers) -> None:
+    """Register the ``batch`` subcommand."""
     batch_parser = subparsers.add_parser("batch", help="Generate multiple agents from a JSON config file")
-    batch_parser.add_argument("config_file", help="Path to JSON configuration file")
+    # Stored as batch_file so it does not clobber the global --config option
+    batch_parser.add_argument(
+        "batch_file", metavar="config_file", help="Path to JSON or JSON Lines (.jsonl) configuration file"
+    )
     batch_parser.add_argument("--output", default="generated_agents", help="Output directory for generated agents")
     batch_parser.add_argument("--template", help="Path to a custom Jinja2 template file")
+    batch_parser.add_argument(
+        "--concurrency",
+        type=_positive_int,
+        default=1,
+        help="Number of worker processes to generate agents with (default: 1)",
+    )
+
 
-    # Web subcommand
+def _add_web_parser(subparsers) -> None:
+    """Register the ``web`` subcommand."""
     web_parser = subparsers.add_parser("web", help="Launch the web interface")
     web_parser.add_argument("--host", default="0.0.0.0", help="Host to bind to")
     web_parser.add_argument("--port", type=int, default=7860, help="Port to bind to")
-    
-    # Config subcommand
+
+
+def _add_config_parser(subparsers) -> None:
+    """Register the ``config`` subcommand and its actions."""
     config_parser = subparsers.add_parser("config", help="Configuration management")
     config_subparsers = config_parser.add_subparsers(dest="config_action", help="Configuration actions")
     
@@ -311,11 +605,108 @@ Examples:
     generate_config_parser = config_subparsers.add_parser("generate", help="Generate default configuration file")
     generate_config_parser.add_argument("--output", default="config.yaml", help="Output file path")
     generate_config_parser.add_argument("--format", choices=["yaml", "json"], default="yaml", help="Output format")
+
+
+# Subcommand builders in help-listing order
+_SUBCOMMAND_BUILDERS = {
+    "generate": _add_generate_parser,
+    "list": _add_list_parser,
+    "test": _add_test_parser,
+    "batch": _add_batch_parser,
+    "web": _add_web_parser,
+    "config": _add_config_parser,
+}
+
+
+_EPILOG = """
+Examples:
+  # Generate an agent interactively
+  llm-agent-builder generate
+
+  # Generate with command-line arguments
+  llm-agent-builder generate --name CodeReviewer --prompt "You are a code reviewer" --task "Review this code"
+
+  # List all generated agents
+  llm-agent-builder list
+
+  # Test an agent
+  llm-agent-builder test generated_agents/myagent.py --task "Review this function"
+
+  # Batch generate from config file
+  llm-agent-builder batch agents.json
+  
+  # Configuration management
+  llm-agent-builder config show
+  llm-agent-builder config validate --file config/production.yaml
+  llm-agent-builder config generate
+        """
+
+
+# Commands that never read .env-provided settings
+_DOTENV_FREE_COMMANDS = frozenset({"list"})
+
+
+def _is_help_requested(argv: List[str]) -> bool:
+    """Return True if ``argv`` asks for help, including abbreviations of ``--help``."""
+    return any(arg == "-h" or (len(arg) > 2 and "--help".startswith(arg)) for arg in argv)
+
+
+def _sniff_command(argv: List[str]) -> Optional[str]:
+    """
+    Return the subcommand named in ``argv`` without running argparse.
+
+    Returns None when no subcommand is given or when help is requested
+    before it, so the caller falls back to building every subparser.
+    """
+    args = iter(argv)
+    for arg in args:
+        if _is_help_requested([arg]):
+            return None
+        # argparse accepts any unambiguous prefix of --config, e.g. --conf
+        if len(arg) > 2 and "--config".startswith(arg):
+            next(args, None)
+            continue
+        if arg.startswith("-"):
+            continue
+        return arg
+    return None
+
+
+def main() -> None:
+    # Bare invocation is the most common one: go straight to the web interface
+    # without building or running the argument parser.
+    if len(sys.argv) == 1:
+        from dotenv import load_dotenv
+
+        print("No command provided. Launching web interface...")
+        load_dotenv()
+        run_web_server("0.0.0.0", 7860)
+        return
+
+    parser = argparse.ArgumentParser(
+        description="LLM Agent Builder - Generate, test, and manage AI agents",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=_EPILOG if _is_help_requested(sys.argv[1:]) else None,
+    )
+    
+    # Global arguments
+    parser.add_argument("--config", help="Path to configuration file", dest="config_file")
+    
+    subparsers = parser.add_subparsers(dest="command", help="Available commands")
+
+    # Only build the full subparser for the command being run. The others are
+    # registered as bare placeholders so usage lines and errors still list
+    # every command; top-level help and unknown commands get the full set.
+    command = _sniff_command(sys.argv[1:])
+    for name, add_subparser in _SUBCOMMAND_BUILDERS.items():
+        if command is None or command not in _SUBCOMMAND_BUILDERS or name == command:
+            add_subparser(subparsers)
+        else:
+            subparsers.add_parser(name)
     
     args = parser.parse_args()
 
-    # Handle no command (default to generate in interactive mode)
-    # Handle no command (default to web interface)
+    # Handle no command but global options only (default to web interface)
     if not args.command:
         print("No command provided. Launching web interface...")
         args.command = "web"
@@ -323,6 +714,13 @@ Examples:
         args.host = "0.0.0.0"
         args.port = 7860
 
+    # .env only matters to commands that read API keys or configuration, so
+    # help (which exits inside parse_args) and listing agents skip it.
+    if args.command not in _DOTENV_FREE_COMMANDS:
+        from dotenv import load_dotenv
+
+        load_dotenv()
+
     try:
         # Load configuration early if --config flag is provided
         if hasattr(args, 'config_file') and args.config_file:
@@ -332,12 +730,8 @@ Examples:
         if args.command == "config":
             handle_config_command(args)
         elif args.command == "generate":
-            # Interactive mode: triggered by --interactive flag or when no arguments provided
-            # Check if user provided any arguments after the script name:
-            # - len(sys.argv) == 1: no command provided (handled above, sets args.interactive=True)
-            # - len(sys.argv) == 2: only "generate" command provided (no additional args)
-            # - len(sys.argv) > 2: additional arguments provided (use command-line mode)
-            # This check is robust and doesn't depend on args.interactive being set above
+            # Interactive mode: triggered by --interactive flag or when "generate"
+            # is given with no further arguments (len(sys.argv) == 2)
             no_args_provided = len(sys.argv) <= 2
 
             if args.interactive or no_args_provided:
@@ -378,16 +772,12 @@ Examples:
                 print(f"Error: {e}")
                 sys.exit(1)
             
-            # Override GOOGLE_GEMINI_MODEL if provided
-            if model:
-                os.environ["GOOGLE_GEMINI_MODEL"] = model
-            
             # Load tools from JSON file if provided
             tools = None
             if tools_path:
                 try:
-                    with open(tools_path, 'r') as f:
-                        tools = json.load(f)
+                    with open(tools_path, 'rb') as f:
+                        tools = _json_loads(f.read())
                         if not isinstance(tools, list):
                             print(f"Warning: Tools file should contain a JSON array. Converting to list.")
                             tools = [tools]
@@ -397,11 +787,13 @@ Examples:
                     print(f"Error: Invalid JSON in tools file: {e}")
                     sys.exit(1)
             
+            from llm_agent_builder.agent_builder import AgentBuilder
+
             # Create an instance of the AgentBuilder
             builder = AgentBuilder(template_path=template)
 
             # Generate the agent code
-            default_model = model or ("gemini-1.5-pro" if provider == "google" else "meta-llama/Meta-Llama-3-8B-Instruct")
+            default_model = model or _PROVIDER_DEFAULT_MODELS.get(provider, _HF_DEFAULT_MODEL)
             agent_code = builder.build_agent(
                 agent_name=name,
                 prompt=prompt,
@@ -418,25 +810,22 @@ Examples:
             output_path = os.path.join(output, f"{name.lower()}.py")
 
             # Write the generated code to a file
-            with open(output_path, "w") as f:
-                f.write(agent_code)
+            _write_agent_file(output_path, agent_code)
 
             print(f"\n✓ Agent '{name}' has been created and saved to '{output_path}'")
             print("\nTo use the agent, ensure you have configured the appropriate API key:")
-            config_manager = get_config_manager()
-            status = config_manager.get_configuration_status()
-            for provider_key, info in status.items():
+            for provider_key, info in _configuration_status().items():
                 if info['configured']:
                     print(f"  ✓ {info['name']}: {info['env_var']} is set")
             
         elif args.command == "list":
-            list_agents(args.output)
+            list_agents(args.output, args.limit)
 
         elif args.command == "test":
             test_agent(args.agent_path, args.task)
 
         elif args.command == "batch":
-            batch_generate(args.config_file, args.output, args.template)
+            batch_generate(args.batch_file, args.output, args.template, args.concurrency)
 
         elif args.command == "web":
             run_web_server(args.host, args.port)
@@ -11,6 +11,13 @@ from .models import AppConfig
 
 logger = logging.getLogger(__name__)
 
+# Human-readable provider names for status output
+PROVIDER_DISPLAY_NAMES = {
+    "google": "Google Gemini",
+    "anthropic": "Anthropic Claude",
+    "huggingface": "HuggingFace",
+}
+
 
 class ConfigManager:
     """
@@ -358,12 +365,38 @@ class ConfigManager:
             else:
                 return False, f"Unsupported file format: {path.suffix}"
             
+            # Reject non-mapping documents before handing them to Pydantic
+            if not isinstance(config_dict, dict):
+                return False, f"Configuration must be a mapping, got {type(config_dict).__name__}"
+            
             # Validate with Pydantic
-            AppConfig(**config_dict)
+            AppConfig.model_validate(config_dict)
             return True, None
         except Exception as e:
             return False, str(e)
     
+    def get_configuration_status(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the API key status of each configured provider.
+        
+        Returns:
+            Mapping of provider name to its display name, API key
+            environment variable, whether that key is set, and the
+            provider's default model when it is.
+        """
+        status: Dict[str, Dict[str, Any]] = {}
+        for provider, provider_config in self.config.providers:
+            if provider_config is None:
+                continue
+            configured = bool(os.environ.get(provider_config.api_key_env))
+            status[provider] = {
+                "name": PROVIDER_DISPLAY_NAMES.get(provider, provider),
+                "env_var": provider_config.api_key_env,
+                "configured": configured,
+                "model": provider_config.default_model if configured else None,
+            }
+        return status
+    
     def to_dict(self) -> Dict[str, Any]:
         """Export configuration as dictionary."""
         return self.config.model_dump()
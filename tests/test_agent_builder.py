@@ -20,3 +20,17 @@ def test_build_agent_content():
     assert f'self.prompt = "{prompt}"' in code
     assert f'model=os.environ.get("ANTHROPIC_MODEL", "{model}")' in code
     assert "import anthropic" in code
+
+
+def test_build_agent_reuses_provider_template(tmp_path):
+    (tmp_path / "agent_template.py.j2").write_text("class {{ agent_name }}:\n    model = '{{ model }}'\n")
+    builder = AgentBuilder(template_path=str(tmp_path))
+
+    first = builder.build_agent("First", "prompt", "task", model="gemini-1.5-pro", provider="google")
+    template = builder._provider_templates["google"]
+    second = builder.build_agent("Second", "prompt", "task", model="gemini-1.5-flash", provider="google")
+
+    assert builder._provider_templates["google"] is template
+    assert "class First:" in first
+    assert "class Second:" in second
+    assert "gemini-1.5-flash" in second
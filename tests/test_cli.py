@@ -1,7 +1,12 @@
+import codecs
 import json
 import os
 import subprocess
 import sys
+import threading
+import time
+
+import pytest
 
 
 def test_cli_help():
@@ -137,3 +142,376 @@ def test_cli_invalid_agent_name():
 
     assert result.returncode != 0
     assert "Error" in result.stdout or "Error" in result.stderr
+
+
+def test_sniff_command():
+    from llm_agent_builder.cli import _sniff_command
+
+    assert _sniff_command(["list", "--output", "agents"]) == "list"
+    assert _sniff_command(["--config", "config/test.yaml", "batch", "agents.json"]) == "batch"
+    assert _sniff_command(["--conf", "list", "generate", "--help"]) == "generate"
+    assert _sniff_command(["--conf", "config/test.yaml", "list"]) == "list"
+    assert _sniff_command(["-h", "generate"]) is None
+    assert _sniff_command([]) is None
+
+
+def test_cli_usage_error_lists_every_command():
+    result = subprocess.run(
+        [sys.executable, "-m", "llm_agent_builder.cli", "list", "--bogus"], capture_output=True, text=True
+    )
+    assert result.returncode == 2
+    assert "{generate,list,test,batch,web,config}" in result.stderr
+
+
+def _get_input_on_terminal(keystrokes):
+    """Run get_input("Agent Name", "MyAgent") on a pseudo-terminal and return its answer."""
+    pty = pytest.importorskip("pty")
+    pytest.importorskip("readline")
+    import select
+
+    code = (
+        "from llm_agent_builder.cli import get_input, validate_agent_name\n"
+        "print('ANSWER=' + get_input('Agent Name', 'MyAgent', validate_agent_name))\n"
+    )
+    master, slave = pty.openpty()
+    proc = subprocess.Popen([sys.executable, "-c", code], stdin=slave, stdout=slave, stderr=slave)
+    os.close(slave)
+    output = b""
+
+    def read_until(done):
+        nonlocal output
+        while not done(output):
+            if not select.select([master], [], [], 10)[0]:
+                pytest.fail(f"timed out waiting for get_input, got {output!r}")
+            output += os.read(master, 1024)
+
+    try:
+        for prompts_seen, keys in enumerate(keystrokes):
+            # Type each line only once the prompt for it has been printed
+            read_until(lambda out: out.count(b"[MyAgent]: ") > prompts_seen)
+            os.write(master, keys)
+        read_until(lambda out: b"ANSWER=" in out and out.endswith(b"\n"))
+    finally:
+        proc.kill()
+        proc.wait()
+        os.close(master)
+    return output.decode().split("ANSWER=")[1].strip()
+
+
+def test_get_input_typed_text_replaces_default():
+    assert _get_input_on_terminal([b"Foo\r"]) == "Foo"
+
+
+def test_get_input_prefills_rejected_answer_on_retry():
+    # The retry starts with "Bad!" already typed; one backspace makes it valid
+    assert _get_input_on_terminal([b"Bad!\r", b"\x7f\r"]) == "Bad"
+
+
+def test_read_batch_configs_json_lines(tmp_path):
+    from llm_agent_builder.cli import _read_batch_configs
+
+    array_file = tmp_path / "agents.json"
+    array_file.write_text(json.dumps([{"name": "A"}, {"name": "B"}]))
+    assert _read_batch_configs(array_file) == [{"name": "A"}, {"name": "B"}]
+
+    lines_file = tmp_path / "agents.jsonl"
+    lines_file.write_text('{"name": "A"}\n\n{"name": "B"}\n')
+    configs = _read_batch_configs(lines_file)
+    assert not isinstance(configs, list)
+    assert list(configs) == [{"name": "A"}, {"name": "B"}]
+
+
+def test_read_batch_configs_rejects_non_arrays_unparsed(tmp_path, monkeypatch):
+    from llm_agent_builder import cli
+
+    config_file = tmp_path / "agents.json"
+    config_file.write_text('  "not an array" ' + "x" * 1000)
+    monkeypatch.setattr(cli, "_json_loads", lambda data: pytest.fail("file should not be parsed"))
+
+    assert cli._read_batch_configs(config_file) is None
+
+
+@pytest.mark.parametrize("json_module", ["orjson", "json"])
+def test_read_batch_configs_accepts_utf8_bom(tmp_path, monkeypatch, json_module):
+    from llm_agent_builder import cli
+
+    if json_module == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(cli, "_optional_module", lambda name: None)
+    bom = codecs.BOM_UTF8
+    array_file = tmp_path / "agents.json"
+    array_file.write_bytes(bom + json.dumps([{"name": "A"}]).encode())
+    lines_file = tmp_path / "agents.jsonl"
+    lines_file.write_bytes(bom + b'{"name": "A"}\n{"name": "B"}\n')
+
+    assert cli._read_batch_configs(array_file) == [{"name": "A"}]
+    assert list(cli._read_batch_configs(lines_file)) == [{"name": "A"}, {"name": "B"}]
+
+
+def test_read_batch_configs_streams_arrays_with_utf8_bom(tmp_path, monkeypatch):
+    pytest.importorskip("ijson")
+    from llm_agent_builder import cli
+
+    array_file = tmp_path / "agents.json"
+    array_file.write_bytes(codecs.BOM_UTF8 + json.dumps([{"name": "A"}]).encode())
+    monkeypatch.setattr(cli, "_BATCH_STREAM_THRESHOLD_BYTES", 1)
+
+    assert list(cli._read_batch_configs(array_file)) == [{"name": "A"}]
+
+
+def test_read_batch_configs_objects_need_jsonl_suffix(tmp_path):
+    from llm_agent_builder.cli import _read_batch_configs
+
+    pretty_file = tmp_path / "agent.json"
+    pretty_file.write_text(json.dumps({"name": "A", "prompt": "p"}, indent=2))
+    one_line_file = tmp_path / "one.json"
+    one_line_file.write_text(json.dumps({"name": "A"}))
+
+    assert _read_batch_configs(pretty_file) is None
+    assert _read_batch_configs(one_line_file) is None
+
+
+def test_validate_agent_name():
+    from llm_agent_builder.cli import validate_agent_name
+
+    for name in ["CodeReviewer", "code_reviewer-2", "Agenté", "_1", "-a-"]:
+        validate_agent_name(name)
+    for name in ["", "Invalid Name!", "agent.py", "-", "_", "__", "-_-"]:
+        with pytest.raises(ValueError):
+            validate_agent_name(name)
+
+
+def test_list_agents_only_lists_python_files(tmp_path, capsys):
+    from llm_agent_builder.cli import list_agents
+
+    (tmp_path / "zeta.py").write_text("")
+    (tmp_path / "alpha.py").write_text("")
+    (tmp_path / "notes.txt").write_text("")
+    (tmp_path / "package.py").mkdir()
+
+    list_agents(str(tmp_path))
+
+    out = capsys.readouterr().out
+    assert "Found 2 agent(s)" in out
+    assert out.index("alpha") < out.index("zeta")
+    assert "notes" not in out
+    assert "package" not in out
+
+
+def test_batch_generate_concurrent(tmp_path, capsys):
+    from llm_agent_builder.cli import batch_generate
+
+    template_dir = tmp_path / "templates"
+    template_dir.mkdir()
+    (template_dir / "agent_template.py.j2").write_text("class {{ agent_name }}:\n    pass\n")
+    config_file = tmp_path / "agents.jsonl"
+    config_file.write_text(
+        "\n".join(json.dumps({"name": f"Agent{i}", "prompt": "p", "task": "t"}) for i in range(1, 6))
+    )
+    output_dir = tmp_path / "out"
+
+    batch_generate(str(config_file), str(output_dir), str(template_dir), concurrency=3)
+
+    out = capsys.readouterr().out
+    assert [line.split("]")[0].strip() for line in out.splitlines() if "✓" in line] == [
+        f"[{i}" for i in range(1, 6)
+    ]
+    for i in range(1, 6):
+        assert (output_dir / f"agent{i}.py").read_text().startswith(f"class Agent{i}:")
+
+
+def test_batch_generate_concurrent_streams_in_windows(tmp_path, monkeypatch):
+    from llm_agent_builder import cli
+
+    template_dir = tmp_path / "templates"
+    template_dir.mkdir()
+    (template_dir / "agent_template.py.j2").write_text("class {{ agent_name }}:\n    pass\n")
+    config_file = tmp_path / "agents.jsonl"
+    config_file.write_text("")
+    pulled = []
+
+    def configs(path):
+        for i in range(1, 21):
+            pulled.append(i)
+            yield {"name": f"Agent{i}", "prompt": "p", "task": "t"}
+
+    pulled_at_first_line = []
+
+    def write_progress(lines):
+        for line in lines:
+            if not pulled_at_first_line:
+                pulled_at_first_line.append(len(pulled))
+
+    monkeypatch.setattr(cli, "_read_batch_configs", configs)
+    monkeypatch.setattr(cli, "_STREAM_CHUNKSIZE", 1)
+    monkeypatch.setattr(cli, "_write_progress", write_progress)
+
+    cli.batch_generate(str(config_file), str(tmp_path / "out"), str(template_dir), concurrency=2)
+
+    # One window is 2 workers * 4 * chunksize 1 entries
+    assert pulled_at_first_line == [8]
+    assert len(list((tmp_path / "out").iterdir())) == 20
+
+
+def test_batch_generate_sequential_writes(tmp_path, capsys):
+    from llm_agent_builder.cli import batch_generate
+
+    template_dir = tmp_path / "templates"
+    template_dir.mkdir()
+    (template_dir / "agent_template.py.j2").write_text("class {{ agent_name }}:\n    pass\n")
+    config_file = tmp_path / "agents.json"
+    config_file.write_text(json.dumps([{"name": f"Agent{i}", "prompt": "p", "task": "t"} for i in range(1, 4)]))
+    output_dir = tmp_path / "out"
+
+    batch_generate(str(config_file), str(output_dir), str(template_dir))
+
+    out = capsys.readouterr().out
+    assert f"-> {os.path.join(str(output_dir), 'agent1.py')}" in out
+    for i in range(1, 4):
+        assert (output_dir / f"agent{i}.py").read_text().startswith(f"class Agent{i}:")
+
+
+def test_write_agent_file_replaces_atomically(tmp_path):
+    from llm_agent_builder.cli import _write_agent_file
+
+    agent_file = tmp_path / "agent.py"
+    agent_file.write_text("old")
+
+    _write_agent_file(agent_file, "new ✓")
+
+    assert agent_file.read_text(encoding="utf-8") == "new ✓"
+    assert [p.name for p in tmp_path.iterdir()] == ["agent.py"]
+
+
+def test_list_agents_limit(tmp_path, capsys):
+    from llm_agent_builder.cli import list_agents
+
+    for name in ["delta", "alpha", "charlie", "bravo"]:
+        (tmp_path / f"{name}.py").write_text("")
+
+    list_agents(str(tmp_path), limit=2)
+
+    out = capsys.readouterr().out
+    assert "Found 4 agent(s)" in out
+    assert "alpha" in out and "bravo" in out
+    assert "charlie" not in out and "delta" not in out
+    assert "... and 2 more" in out
+
+
+def test_cli_list_rejects_negative_limit(tmp_path):
+    result = subprocess.run(
+        [sys.executable, "-m", "llm_agent_builder.cli", "list", "--output", str(tmp_path), "--limit", "-1"],
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 2
+    assert "must be 0 or greater" in result.stderr
+
+
+@pytest.mark.parametrize("value", ["0", "-2"])
+def test_cli_batch_rejects_non_positive_concurrency(tmp_path, value):
+    config_file = tmp_path / "agents.json"
+    config_file.write_text("[]")
+    result = subprocess.run(
+        [sys.executable, "-m", "llm_agent_builder.cli", "batch", str(config_file), "--concurrency", value],
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 2
+    assert "must be" in result.stderr
+    assert "or greater" in result.stderr
+
+
+def test_read_batch_configs_streams_large_arrays(tmp_path, monkeypatch):
+    pytest.importorskip("ijson")
+    from llm_agent_builder import cli
+
+    array_file = tmp_path / "agents.json"
+    array_file.write_text(json.dumps([{"name": "A", "temperature": 0.5}, {"name": "B"}]))
+    monkeypatch.setattr(cli, "_BATCH_STREAM_THRESHOLD_BYTES", 1)
+
+    configs = cli._read_batch_configs(array_file)
+
+    assert not isinstance(configs, list)
+    assert list(configs) == [{"name": "A", "temperature": 0.5}, {"name": "B"}]
+
+
+def test_test_agent_uses_configured_api_key_env(tmp_path, monkeypatch, capfd):
+    from llm_agent_builder import cli
+    from llm_agent_builder.config import get_config_manager, reload_config
+
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text(
+        "providers:\n  google:\n    api_key_env: MY_GEMINI_KEY\n    default_model: gemini-1.5-pro\n"
+    )
+    reload_config(str(config_file))
+    cli._configuration_status.cache_clear()
+    for info in get_config_manager().get_configuration_status().values():
+        monkeypatch.delenv(info["env_var"], raising=False)
+    monkeypatch.setenv("MY_GEMINI_KEY", "test-key")
+    script = tmp_path / "agent.py"
+    script.write_text("print('ran')\n")
+
+    try:
+        cli.test_agent(str(script), task="t")
+    finally:
+        reload_config()
+        cli._configuration_status.cache_clear()
+
+    assert "ran" in capfd.readouterr().out
+
+
+def test_run_agent_streaming_echoes_output(tmp_path, capfd):
+    from llm_agent_builder.cli import _run_agent_streaming
+
+    script = tmp_path / "agent.py"
+    script.write_text("import sys\nprint('to stdout')\nprint('to stderr', file=sys.stderr)\nsys.exit(2)\n")
+
+    returncode = _run_agent_streaming([sys.executable, str(script)], timeout=30)
+
+    captured = capfd.readouterr()
+    assert returncode == 2
+    assert "to stdout" in captured.out
+    assert "to stderr" in captured.err
+
+
+def test_run_agent_streaming_is_live(tmp_path, monkeypatch, capfd):
+    from llm_agent_builder.cli import _run_agent_streaming
+
+    # The agent only finishes successfully once the parent has seen its first
+    # line, which is impossible if that line is held back until exit.
+    seen = tmp_path / "seen"
+    script = tmp_path / "agent.py"
+    script.write_text(
+        "import os, sys, time\n"
+        "print('first')\n"
+        "deadline = time.monotonic() + 10\n"
+        f"while not os.path.exists({str(seen)!r}):\n"
+        "    if time.monotonic() > deadline:\n"
+        "        sys.exit(3)\n"
+        "    time.sleep(0.01)\n"
+    )
+
+    def watch():
+        output = ""
+        while "first" not in output:
+            output += capfd.readouterr().out
+            time.sleep(0.01)
+        seen.touch()
+
+    monkeypatch.delenv("PYTHONUNBUFFERED", raising=False)
+    watcher = threading.Thread(target=watch, daemon=True)
+    watcher.start()
+
+    assert _run_agent_streaming([sys.executable, str(script)], timeout=30) == 0
+
+
+def test_run_agent_streaming_timeout(tmp_path):
+    from llm_agent_builder.cli import _run_agent_streaming
+
+    script = tmp_path / "agent.py"
+    script.write_text("import time\ntime.sleep(30)\n")
+
+    with pytest.raises(subprocess.TimeoutExpired):
+        _run_agent_streaming([sys.executable, str(script)], timeout=0.5)
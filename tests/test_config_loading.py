@@ -173,6 +173,21 @@ def test_config_get_api_key(clean_env, monkeypatch):
     assert api_key is None
 
 
+def test_config_get_configuration_status(clean_env, monkeypatch):
+    """Test provider status reflects which API keys are set."""
+    monkeypatch.setenv("GOOGLE_GEMINI_KEY", "test-key-123")
+    monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
+    reload_config()
+    
+    status = get_config_manager().get_configuration_status()
+    
+    assert status["google"]["configured"] is True
+    assert status["google"]["env_var"] == "GOOGLE_GEMINI_KEY"
+    assert status["google"]["model"] == get_config().providers.google.default_model
+    assert status["anthropic"]["configured"] is False
+    assert status["anthropic"]["model"] is None
+
+
 def test_config_validates_on_load(tmp_path, clean_env, monkeypatch):
     """Test that invalid configuration raises validation error."""
     # Create invalid config file
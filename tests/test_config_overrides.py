@@ -260,6 +260,19 @@ def test_validate_config_file_not_found():
     assert "not found" in error.lower()
 
 
+def test_validate_config_file_not_a_mapping(tmp_path):
+    """Test validate_config_file rejects a top-level list."""
+    list_config = tmp_path / "list.yaml"
+    with open(list_config, 'w') as f:
+        yaml.dump([{"server": {"port": 8080}}], f)
+    
+    manager = get_config_manager()
+    is_valid, error = manager.validate_config_file(list_config)
+    
+    assert is_valid is False
+    assert "mapping" in error
+
+
 def test_reload_with_different_config(tmp_path, clean_env, monkeypatch):
     """Test reloading with a different configuration file."""
     # First config